@@ -2738,6 +2738,7 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         seed: int | None = None,
         multistart_gen: MultiStartGenerator | None = None,
         score_fn_gen: CostFunctionGenerator | None = None,
+        num_threads: int | None = 1,
         **kwargs: Any,
     ) -> Circuit:
         """
@@ -2773,6 +2774,10 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
 
             score_fn_gen (CostFunctionGenerator):  (Deprecated)
 
+            num_threads (int | None): The number of threads to spread the
+                `multistarts` instantiations over. If None, use one thread
+                per available cpu. (Default: 1)
+
             kwargs (dict[str, Any]): Method specific options, passed
                 directly to method constructor. For more info, see
                 `bqskit.ir.opt.instantiaters`.
@@ -2865,7 +2870,12 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         instantiater = cast(Instantiater, instantiater)
 
         # Instantiate
-        instantiater.multi_start_instantiate_inplace(self, target, multistarts)
+        instantiater.multi_start_instantiate_inplace(
+            self,
+            target,
+            multistarts,
+            num_threads,
+        )
         return self
 
     def minimize(self, cost: CostFunction, **kwargs: Any) -> None:
@@ -1,6 +1,7 @@
 """This module implements the CircuitGate class."""
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -42,8 +43,24 @@ class CircuitGate(Gate):
         self._num_params = self._circuit.num_params
         self._name = 'CircuitGate(%s)' % str(self._circuit)
 
+    @cached_property
+    def utry(self) -> UnitaryMatrix:
+        """
+        The unitary of the wrapped circuit at its stored parameters.
+
+        This is only computed on first access, since many CircuitGates are
+        constructed for their metadata and never have their unitary read.
+        The result is shared by every caller, so it is made read-only.
+        """
+        utry = self._circuit.get_unitary()
+        utry.numpy.setflags(write=False)
+        return utry
+
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """Return the unitary for this gate, see :class:`Unitary` for more."""
+        if len(params) == 0:
+            return self.utry
+
         return self._circuit.get_unitary(params)
 
     def get_grad(self, params: RealVector = []) -> npt.NDArray[np.complex128]:
@@ -52,6 +69,9 @@ class CircuitGate(Gate):
 
         See :class:`DifferentiableUnitary` for more info.
         """
+        if len(params) == 0 and self.num_params == 0:
+            return np.array([])
+
         return self._circuit.get_grad(params)
 
     def get_unitary_and_grad(
@@ -63,6 +83,10 @@ class CircuitGate(Gate):
 
         See :class:`DifferentiableUnitary` for more info.
         """
+        if len(params) == 0 and self.num_params == 0:
+            # A constant sub-circuit is fully described by its cached unitary
+            return self.utry, np.array([])
+
         return self._circuit.get_unitary_and_grad(params)
 
     def is_differentiable(self) -> bool:
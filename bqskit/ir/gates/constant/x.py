@@ -1,6 +1,8 @@
 """This module implements the XGate."""
 from __future__ import annotations
 
+import numpy as np
+
 from bqskit.ir.gates.constantgate import ConstantGate
 from bqskit.ir.gates.qubitgate import QubitGate
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
@@ -23,8 +25,12 @@ class XGate(ConstantGate, QubitGate):
     _num_qudits = 1
     _qasm_name = 'x'
     _utry = UnitaryMatrix(
-        [
-            [0, 1],
-            [1, 0],
-        ],
+        np.array(
+            [
+                [0, 1],
+                [1, 0],
+            ],
+            dtype=np.complex128,
+        ),
+        check_arguments=False,
     )
@@ -3,10 +3,14 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 from bqskit.ir.gates.constantgate import ConstantGate
 from bqskit.ir.gates.qubitgate import QubitGate
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
 
+_s = math.sqrt(0.5)
+
 
 class YYGate(ConstantGate, QubitGate):
     """
@@ -27,10 +31,14 @@ class YYGate(ConstantGate, QubitGate):
     _num_qudits = 2
     _qasm_name = 'ryy(pi/2)'
     _utry = UnitaryMatrix(
-        [
-            [math.sqrt(2) / 2, 0, 0, 1j * math.sqrt(2) / 2],
-            [0, math.sqrt(2) / 2, -1j * math.sqrt(2) / 2, 0],
-            [0, -1j * math.sqrt(2) / 2, math.sqrt(2) / 2, 0],
-            [1j * math.sqrt(2) / 2, 0, 0, math.sqrt(2) / 2],
-        ],
+        np.array(
+            [
+                [_s, 0, 0, 1j * _s],
+                [0, _s, -1j * _s, 0],
+                [0, -1j * _s, _s, 0],
+                [1j * _s, 0, 0, _s],
+            ],
+            dtype=np.complex128,
+        ),
+        check_arguments=False,
     )
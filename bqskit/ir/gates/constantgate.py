@@ -1,6 +1,8 @@
 """This module implements the ConstantGate base class."""
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 import numpy.typing as npt
 
@@ -18,11 +20,24 @@ class ConstantGate(
     LocallyOptimizableUnitary,
     CachedClass,
 ):
-    """A gate that does not change during circuit instantiation."""
+    """
+    A gate that does not change during circuit instantiation.
+
+    Subclasses that define `_utry` at the class level share that single
+    unitary across all instances. Its underlying buffer is marked read-only
+    so the shared matrix cannot be modified through any one instance.
+    """
 
     _num_params = 0
     _utry: UnitaryMatrix
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Freeze the class-level unitary of a constant gate subclass."""
+        super().__init_subclass__(**kwargs)
+        utry = cls.__dict__.get('_utry', None)
+        if isinstance(utry, UnitaryMatrix):
+            utry.numpy.setflags(write=False)
+
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """Return the unitary for this gate, see :class:`Unitary` for more."""
         self.check_parameters(params)
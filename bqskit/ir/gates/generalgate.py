@@ -32,6 +32,13 @@ class GeneralGate(Gate, LocallyOptimizableUnitary):
         See :class:`LocallyOptimizableUnitary` for more info.
         """
         self.check_env_matrix(env_matrix)
-        U, _, Vh = sp.linalg.svd(env_matrix)
-        new_U = Vh.conj().T @ U.conj().T
-        return self.calc_params(UnitaryMatrix(new_U, self.radixes))
+        U, _, Vh = sp.linalg.svd(
+            env_matrix,
+            full_matrices=False,
+            check_finite=False,
+            lapack_driver='gesdd',
+        )
+
+        # The optimal unitary is the adjoint of the polar factor U @ Vh
+        new_U = (U @ Vh).conj().T
+        return self.calc_params(UnitaryMatrix(new_U, self.radixes, False))
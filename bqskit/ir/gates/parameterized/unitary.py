@@ -1,9 +1,15 @@
 """This module implements the VariableUnitaryGate."""
 from __future__ import annotations
 
+from functools import lru_cache
+from math import prod
+from typing import Any
+from typing import Callable
 from typing import Sequence
 
 import numpy as np
+import numpy.typing as npt
+from scipy.linalg import get_lapack_funcs
 
 from bqskit.ir.gates.generalgate import GeneralGate
 from bqskit.qis.unitary.unitary import RealVector
@@ -12,9 +18,26 @@ from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
 from bqskit.utils.typing import is_valid_radixes
 
 
+@lru_cache(maxsize=None)
+def _get_gesdd(
+    dim: int,
+    dtype: np.dtype[Any] = np.dtype(np.complex128),
+) -> tuple[Callable[..., Any], int]:
+    """Return the LAPACK gesdd routine and workspace for `dim` and `dtype`."""
+    dummy = np.empty((dim, dim), dtype=dtype)
+    gesdd, gesdd_lwork = get_lapack_funcs(('gesdd', 'gesdd_lwork'), (dummy,))
+    work, info = gesdd_lwork(dim, dim, compute_uv=1, full_matrices=0)
+    if info != 0:
+        raise RuntimeError('Unable to query LAPACK gesdd workspace size.')
+    return gesdd, int(np.ceil(work.real))
+
+
 class VariableUnitaryGate(GeneralGate):
     """A Variable n-qudit unitary operator."""
 
+    # The precision used to assemble and project the unitary
+    _dtype: type[np.complexfloating[Any, Any]] = np.complex128
+
     def __init__(self, num_qudits: int, radixes: Sequence[int] = []) -> None:
         """
         Creates an VariableUnitaryGate, defaulting to a qubit gate.
@@ -36,13 +59,16 @@ class VariableUnitaryGate(GeneralGate):
 
         self._num_qudits = int(num_qudits)
         self._radixes = tuple(radixes)
-        self._dim = int(np.prod(self.radixes))
+        self._dim = prod(self.radixes)
         self.shape = (self.dim, self.dim)
         self._num_params = 2 * self.dim**2
         self._name = 'VariableUnitaryGate(%d, %s)' % (
             self.num_qudits, str(self.radixes),
         )
 
+        # Resolve the LAPACK routine used by `get_unitary` up front
+        _get_gesdd(self.dim, np.dtype(self._dtype))
+
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """
         Return the unitary for this gate, see :class:`Unitary` for more.
@@ -51,20 +77,115 @@ class VariableUnitaryGate(GeneralGate):
             Ideally, params form a unitary matrix when reshaped,
             however, params are unconstrained so we return the closest
             UnitaryMatrix to the given matrix.
+
+            The matrix is assembled and projected in the precision given
+            by the `_dtype` class attribute. A subclass may set this to
+            `np.complex64` to halve the memory traffic of the projection,
+            at the cost of a result that is only unitary to roughly 1e-6.
+            The returned UnitaryMatrix is always complex128.
         """
         self.check_parameters(params)
-        mid = len(params) // 2
-        real = np.array(params[:mid], dtype=np.complex128)
-        imag = 1j * np.array(params[mid:], dtype=np.complex128)
-        x = real + imag
-        return UnitaryMatrix.closest_to(np.reshape(x, self.shape), self.radixes)
+        p = np.asarray(params, dtype=np.float64)
+        if not np.isfinite(p).all():
+            raise ValueError('array must not contain infs or NaNs')
+        mid = p.size // 2
+
+        # Interleave real and imaginary parts, then view them as complex
+        dtype = np.dtype(self._dtype)
+        buf = np.empty(2 * mid, dtype=np.finfo(dtype).dtype)
+        buf[0::2] = p[:mid]
+        buf[1::2] = p[mid:]
+        x = buf.view(dtype).reshape(self.shape)
+
+        # Project onto the closest unitary, see `UnitaryMatrix.closest_to`.
+        # LAPACK expects Fortran order, so decompose the F-contiguous x.T
+        # in place; the closest unitary to x.T is the transpose of ours.
+        V, Wh = self._svd(x.T, overwrite_a=True)
+        return UnitaryMatrix((V @ Wh).T, self.radixes, False)
 
     def calc_params(self, utry: UnitaryLike) -> list[float]:
         """Return the parameters for this gate to implement `utry`"""
         if 2 * len(utry) ** 2 != self.num_params:
             raise ValueError('Mismatch in unitary and gate dimension.')
-        x = np.reshape(utry, (self.num_params // 2,))
-        return list(np.real(x)) + list(np.imag(x))
+        x = np.asarray(utry, dtype=np.complex128).reshape(-1)
+        mid = self.num_params // 2
+        out = np.empty(self.num_params, dtype=np.float64)
+        out[:mid] = x.real
+        out[mid:] = x.imag
+        return out.tolist()
+
+    def optimize(self, env_matrix: npt.NDArray[np.complex128]) -> list[float]:
+        """
+        Return the optimal parameters with respect to an environment matrix.
+
+        See :class:`LocallyOptimizableUnitary` for more info.
+        """
+        self.check_env_matrix(env_matrix)
+        env_matrix = np.asarray(env_matrix, dtype=np.complex128)
+
+        # With env_matrix.T = V @ S @ Wh, the optimal unitary is conj(V @ Wh)
+        V, Wh = self._svd(env_matrix.T)
+        return self.calc_params(np.conj(V @ Wh))
+
+    def optimize_batch(
+        self,
+        env_matrices: npt.NDArray[np.complex128],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the optimal parameters for each of a stack of environments.
+
+        This is equivalent to calling :func:`optimize` on every matrix in
+        `env_matrices`, but writes all of the results into one array.
+
+        Args:
+            env_matrices (npt.NDArray[np.complex128]): A stack of
+                environment matrices with shape (B, `dim`, `dim`).
+
+        Returns:
+            (npt.NDArray[np.float64]): The optimal parameters with shape
+                (B, `num_params`); row `i` optimizes `env_matrices[i]`.
+        """
+        env_matrices = np.asarray(env_matrices)
+        if env_matrices.ndim != 3 or env_matrices.shape[1:] != self.shape:
+            raise TypeError('Environmental matrix shape mismatch.')
+
+        env_matrices = env_matrices.astype(np.complex128, copy=False)
+        W = np.empty(env_matrices.shape, dtype=np.complex128)
+        for env_matrix, w in zip(env_matrices, W):
+            V, Wh = self._svd(env_matrix.T)
+            np.matmul(V, Wh, out=w)
+        np.conj(W, out=W)
+        W = W.reshape((len(W), -1))
+
+        mid = self.num_params // 2
+        out = np.empty((len(W), self.num_params), dtype=np.float64)
+        out[:, :mid] = W.real
+        out[:, mid:] = W.imag
+        return out
+
+    def _svd(
+        self,
+        a: npt.NDArray[np.complexfloating[Any, Any]],
+        overwrite_a: bool = False,
+    ) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+        """
+        Return `V` and `Wh` from the reduced SVD `a = V @ S @ Wh`.
+
+        All decompositions in this class go through the cached LAPACK
+        gesdd routine, since the shape is known up front. Pass `a` in
+        Fortran order so that `overwrite_a` can avoid a copy.
+        """
+        gesdd, lwork = _get_gesdd(self.dim, a.dtype)
+        V, _, Wh, info = gesdd(
+            a,
+            compute_uv=1,
+            full_matrices=0,
+            lwork=lwork,
+            overwrite_a=int(overwrite_a),
+        )
+        if info != 0:
+            raise np.linalg.LinAlgError('SVD did not converge.')
+        return V, Wh
 
     @staticmethod
     def get_params(utry: UnitaryLike) -> RealVector:
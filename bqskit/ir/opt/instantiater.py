@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import abc
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -56,11 +58,58 @@ class Instantiater(abc.ABC):
             Instantiater object may happen in parallel.
         """
 
+    def instantiate_multistart(
+        self,
+        circuit: Circuit,
+        target: UnitaryMatrix | StateVector | StateSystem,
+        starts: npt.NDArray[np.float64],
+        num_threads: int | None = 1,
+    ) -> list[npt.NDArray[np.float64]]:
+        """
+        Instantiate `circuit` once from each starting point in `starts`.
+
+        Args:
+            circuit (Circuit): The circuit template to instantiate.
+
+            target (UnitaryMatrix | StateVector | StateSystem): The unitary
+                matrix to implement or state to prepare.
+
+            starts (np.ndarray): The starting points, one per row.
+
+            num_threads (int | None): The number of threads to spread the
+                instantiate calls over. If None, use one thread per
+                available cpu. (Default: 1)
+
+        Returns:
+            (list[np.ndarray]): The instantiated parameters, in the same
+                order as `starts`.
+
+        Notes:
+            Threads avoid the pickling cost of process-based parallelism,
+            but only help when :func:`instantiate` releases the GIL. BQSKit
+            Runtime workers already run one instantiation per process, so
+            the default remains serial.
+        """
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+
+        if num_threads <= 1 or len(starts) <= 1:
+            return [self.instantiate(circuit, target, x0) for x0 in starts]
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            return list(
+                executor.map(
+                    lambda x0: self.instantiate(circuit, target, x0),
+                    starts,
+                ),
+            )
+
     def multi_start_instantiate(
         self,
         circuit: Circuit,
         target: UnitaryLike | StateLike | StateSystemLike,
         num_starts: int,
+        num_threads: int | None = 1,
     ) -> Circuit:
         """
         Instantiate `circuit` to best implement `target` with multiple starts.
@@ -74,6 +123,10 @@ class Instantiater(abc.ABC):
             num_starts (int): The number of starting points to attempt
                 instantiation with.
 
+            num_threads (int | None): The number of threads to spread the
+                starts over, see :func:`instantiate_multistart` for more
+                info. (Default: 1)
+
         Returns:
             (Circuit): A circuit copy with the best parameters with
                 respect to `target`.
@@ -84,7 +137,12 @@ class Instantiater(abc.ABC):
             Instantiater object may happen in parallel.
         """
         _circuit = circuit.copy()
-        self.multi_start_instantiate_inplace(_circuit, target, num_starts)
+        self.multi_start_instantiate_inplace(
+            _circuit,
+            target,
+            num_starts,
+            num_threads,
+        )
         return _circuit
 
     def multi_start_instantiate_inplace(
@@ -92,6 +150,7 @@ class Instantiater(abc.ABC):
         circuit: Circuit,
         target: UnitaryLike | StateLike | StateSystemLike,
         num_starts: int,
+        num_threads: int | None = 1,
     ) -> None:
         """
         Instantiate `circuit` to best implement `target` with multiple starts.
@@ -106,7 +165,12 @@ class Instantiater(abc.ABC):
         start_gen = RandomStartGenerator()
         starts = start_gen.gen_starting_points(num_starts, circuit, target)
         cost_fn = HilbertSchmidtCostGenerator().gen_cost(circuit, target)
-        params_list = [self.instantiate(circuit, target, x0) for x0 in starts]
+        params_list = self.instantiate_multistart(
+            circuit,
+            target,
+            starts,
+            num_threads,
+        )
         params = sorted(params_list, key=lambda x: cost_fn(x))[0]
         circuit.set_params(params)
 
@@ -165,13 +229,18 @@ class Instantiater(abc.ABC):
         target: UnitaryLike | StateLike | StateSystemLike,
     ) -> UnitaryMatrix | StateVector | StateSystem:
         """Check `target` to be valid and return it casted."""
-        # Check `target`
+        # Already-casted targets need no further checks
+        if isinstance(target, (UnitaryMatrix, StateVector, StateSystem)):
+            return target
+
+        # Check `target`; the predicates below already validate it,
+        # so the constructors can skip repeating those checks
         try:
             if UnitaryMatrix.is_unitary(target):
-                target = UnitaryMatrix(target)
+                target = UnitaryMatrix(target, check_arguments=False)
 
             elif StateVector.is_pure_state(target):
-                target = StateVector(target)
+                target = StateVector(target, check_arguments=False)
 
             elif StateSystem.is_state_system(target):
                 target = StateSystem(target)
@@ -97,6 +97,7 @@ class Minimization(Instantiater):
         circuit: Circuit,
         target: UnitaryLike | StateLike | StateSystemLike,
         num_starts: int,
+        num_threads: int | None = 1,
     ) -> None:
         """
         Instantiate `circuit` to best implement `target` with multiple starts.
@@ -107,7 +108,12 @@ class Minimization(Instantiater):
         start_gen = RandomStartGenerator()
         starts = start_gen.gen_starting_points(num_starts, circuit, target)
         cost_fn = self.cost_fn_gen.gen_cost(circuit, target)
-        params_list = [self.instantiate(circuit, target, x0) for x0 in starts]
+        params_list = self.instantiate_multistart(
+            circuit,
+            target,
+            starts,
+            num_threads,
+        )
         params = sorted(params_list, key=lambda x: cost_fn(x))[0]
         circuit.set_params(params)
 
@@ -21,7 +21,7 @@ class MultiStartGenerator(abc.ABC):
         multistarts: int,
         circuit: Circuit,
         target: UnitaryMatrix | StateVector | StateSystem,
-    ) -> list[npt.NDArray[np.float64]]:
+    ) -> npt.NDArray[np.float64]:
         """
         Generate `multistarts` starting points for instantiation.
 
@@ -33,8 +33,9 @@ class MultiStartGenerator(abc.ABC):
             target (UnitaryMatrix | StateVector | StateSystem): The target.
 
         Return:
-            (list[npt.NDArray[np.float64]]): List of starting inputs for
-                instantiation.
+            (npt.NDArray[np.float64]): A contiguous array with shape
+                (`multistarts`, `circuit.num_params`), where each row is
+                a starting input for instantiation.
 
         Raises:
             ValueError: If `multistarts` is not a positive integer.
@@ -24,7 +24,7 @@ class DiagonalStartGenerator(MultiStartGenerator):
         multistarts: int,
         circuit: Circuit,
         target: UnitaryMatrix | StateVector | StateSystem,
-    ) -> list[npt.NDArray[np.float64]]:
+    ) -> npt.NDArray[np.float64]:
         """
         Generate `multistarts` starting points for instantiation.
 
@@ -36,8 +36,9 @@ class DiagonalStartGenerator(MultiStartGenerator):
             target (UnitaryMatrix | StateVector | StateSystem): The target.
 
         Return:
-            (list[npt.NDArray[np.float64]]): List of starting inputs for
-                instantiation.
+            (npt.NDArray[np.float64]): A contiguous array with shape
+                (`multistarts`, `circuit.num_params`), where row `i` is
+                a starting input drawn from the `i`-th diagonal segment.
 
         Raises:
             ValueError: If `multistarts` is not a positive integer.
@@ -54,11 +55,12 @@ class DiagonalStartGenerator(MultiStartGenerator):
                 ', got %d' % multistarts,
             )
 
-        return [
-            2 * np.pi * np.random.uniform(
-                (i - 1) / multistarts,
-                i / multistarts,
-                (circuit.num_params,),
-            )
-            for i in range(1, multistarts + 1)
-        ]
+        lo = np.arange(multistarts) / multistarts
+        hi = np.arange(1, multistarts + 1) / multistarts
+        starts = np.random.uniform(
+            lo[:, None],
+            hi[:, None],
+            (multistarts, circuit.num_params),
+        )
+        starts *= 2 * np.pi
+        return starts
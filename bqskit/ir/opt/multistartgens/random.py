@@ -24,7 +24,7 @@ class RandomStartGenerator(MultiStartGenerator):
         multistarts: int,
         circuit: Circuit,
         target: UnitaryMatrix | StateVector | StateSystem,
-    ) -> list[npt.NDArray[np.float64]]:
+    ) -> npt.NDArray[np.float64]:
         """
         Generate `multistarts` starting points for instantiation.
 
@@ -36,8 +36,9 @@ class RandomStartGenerator(MultiStartGenerator):
             target (UnitaryMatrix | StateVector): The target.
 
         Return:
-            (list[npt.NDArray[np.float64]]): List of starting inputs for
-                instantiation.
+            (npt.NDArray[np.float64]): A contiguous array with shape
+                (`multistarts`, `circuit.num_params`), where each row is
+                a starting input for instantiation.
 
         Raises:
             ValueError: If `multistarts` is not a positive integer.
@@ -54,7 +55,6 @@ class RandomStartGenerator(MultiStartGenerator):
                 ', got %d' % multistarts,
             )
 
-        return [
-            2 * np.pi * np.random.random(circuit.num_params)
-            for i in range(multistarts)
-        ]
+        starts = np.random.random((multistarts, circuit.num_params))
+        starts *= 2 * np.pi
+        return starts
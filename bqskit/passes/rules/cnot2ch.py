@@ -26,7 +26,7 @@ class CNOTToCHPass(BasePass):
         circuit.append_gate(RYGate(), 1, [-np.pi / 4])
         circuit.append_gate(CHGate(), (0, 1))
         circuit.append_gate(RYGate(), 1, [np.pi / 4])
-        self.cg = CircuitGate(circuit)
+        self.cg = CircuitGate(circuit, True)
 
     async def run(self, circuit: Circuit, data: PassData) -> None:
         """Perform the pass's operation, see :class:`BasePass` for more."""
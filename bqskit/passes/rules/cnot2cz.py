@@ -24,7 +24,7 @@ class CNOTToCZPass(BasePass):
         circuit.append_gate(HGate(), 1)
         circuit.append_gate(CZGate(), (0, 1))
         circuit.append_gate(HGate(), 1)
-        self.cg = CircuitGate(circuit)
+        self.cg = CircuitGate(circuit, True)
 
     async def run(self, circuit: Circuit, data: PassData) -> None:
         """Perform the pass's operation, see :class:`BasePass` for more."""
@@ -23,7 +23,7 @@ class SwapToCNOTPass(BasePass):
         circuit.append_gate(CNOTGate(), (1, 0))
         circuit.append_gate(CNOTGate(), (0, 1))
         circuit.append_gate(CNOTGate(), (1, 0))
-        self.cg = CircuitGate(circuit)
+        self.cg = CircuitGate(circuit, True)
 
     async def run(self, circuit: Circuit, data: PassData) -> None:
         """Perform the pass's operation, see :class:`BasePass` for more."""
@@ -110,7 +110,14 @@ class Unitary(metaclass=UnitaryMeta):
                 % type(params),
             )
 
-        if not all(is_real_number(p) for p in params):
+        # A real-valued array's dtype already answers the per-element check
+        is_real_array = (
+            isinstance(params, np.ndarray)
+            and params.ndim == 1
+            and params.dtype.kind in 'iuf'
+        )
+
+        if not is_real_array and not all(is_real_number(p) for p in params):
             typechecks = [is_real_number(p) for p in params]
             fail_idx = typechecks.index(False)
             raise TypeError(
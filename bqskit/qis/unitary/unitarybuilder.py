@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import cast
 from typing import Sequence
 
@@ -19,6 +20,56 @@ from bqskit.utils.typing import is_valid_radixes
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _right_unfolding(
+    location: tuple[int, ...],
+    radixes: tuple[int, ...],
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], int]:
+    """
+    Return the plan for contracting a unitary on the right of a tensor.
+
+    The tensor is unfolded by moving the axes in `location` to the front
+    and reshaping to a (`left_dim`, -1) matrix, so the contraction is a
+    single matmul. The plan is (perm, inv_perm, shape, left_dim), where
+    `shape` is the permuted tensor shape to fold the product back into.
+    """
+    num_qudits = len(radixes)
+    left_perm = list(location)
+    mid_perm = [x for x in range(num_qudits) if x not in left_perm]
+    right_perm = [x + num_qudits for x in range(num_qudits)]
+    left_dim = int(np.prod([radixes[x] for x in left_perm]))
+
+    perm = tuple(left_perm + mid_perm + right_perm)
+    full_shape = radixes * 2
+    shape = tuple(full_shape[p] for p in perm)
+    inv_perm = tuple(int(x) for x in np.argsort(perm))
+    return perm, inv_perm, shape, left_dim
+
+
+@lru_cache(maxsize=4096)
+def _left_unfolding(
+    location: tuple[int, ...],
+    radixes: tuple[int, ...],
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], int]:
+    """
+    Return the plan for contracting a unitary on the left of a tensor.
+
+    Mirrors :func:`_right_unfolding`, but moves the output axes in
+    `location` to the back and reshapes to a (-1, `right_dim`) matrix.
+    """
+    num_qudits = len(radixes)
+    left_perm = list(range(num_qudits))
+    mid_perm = [x + num_qudits for x in left_perm if x not in location]
+    right_perm = [x + num_qudits for x in location]
+    right_dim = int(np.prod([radixes[x - num_qudits] for x in right_perm]))
+
+    perm = tuple(left_perm + mid_perm + right_perm)
+    full_shape = radixes * 2
+    shape = tuple(full_shape[p] for p in perm)
+    inv_perm = tuple(int(x) for x in np.argsort(perm))
+    return perm, inv_perm, shape, right_dim
+
+
 class UnitaryBuilder(Unitary):
     """
     An object for fast unitary accumulation using tensor networks.
@@ -143,23 +194,17 @@ class UnitaryBuilder(Unitary):
                 if utry_radix != self.radixes[bldr_radix_idx]:
                     raise ValueError('Unitary and location radix mismatch.')
 
-        left_perm = list(cast(CircuitLocation, location))
-        mid_perm = [x for x in range(self.num_qudits) if x not in left_perm]
-        right_perm = [x + self.num_qudits for x in range(self.num_qudits)]
-
-        left_dim = int(np.prod([self.radixes[x] for x in left_perm]))
+        perm, inv_perm, shape, left_dim = _right_unfolding(
+            tuple(cast(CircuitLocation, location)),
+            self.radixes,
+        )
 
         utry = utry.dagger if inverse else utry
 
-        perm = left_perm + mid_perm + right_perm
         self.tensor = self.tensor.transpose(perm)
         self.tensor = self.tensor.reshape((left_dim, -1))
         self.tensor = utry @ self.tensor
-
-        shape = list(self.radixes) * 2
-        shape = [shape[p] for p in perm]
         self.tensor = self.tensor.reshape(shape)
-        inv_perm = list(np.argsort(perm))
         self.tensor = self.tensor.transpose(inv_perm)
 
     def apply_left(
@@ -221,33 +266,17 @@ class UnitaryBuilder(Unitary):
                 if utry_radix != self.radixes[bldr_radix_idx]:
                     raise ValueError('Unitary and location radix mismatch.')
 
-        location = cast(CircuitLocation, location)
-        left_perm = list(range(self.num_qudits))
-        mid_perm = [
-            x + self.num_qudits
-            for x in left_perm
-            if x not in location
-        ]
-        right_perm = [x + self.num_qudits for x in location]
-
-        right_dim = int(
-            np.prod([
-                self.radixes[x - self.num_qudits]
-                for x in right_perm
-            ]),
+        perm, inv_perm, shape, right_dim = _left_unfolding(
+            tuple(cast(CircuitLocation, location)),
+            self.radixes,
         )
 
         utry = utry.dagger if inverse else utry
 
-        perm = left_perm + mid_perm + right_perm
         self.tensor = self.tensor.transpose(perm)
         self.tensor = self.tensor.reshape((-1, right_dim))
         self.tensor = self.tensor @ utry
-
-        shape = list(self.radixes) * 2
-        shape = [shape[p] for p in perm]
         self.tensor = self.tensor.reshape(shape)
-        inv_perm = list(np.argsort(perm))
         self.tensor = self.tensor.transpose(inv_perm)
 
     def eval_apply_right(
@@ -260,22 +289,16 @@ class UnitaryBuilder(Unitary):
 
         See :func:`apply_right` for more info.
         """
-        left_perm = list(cast(CircuitLocation, location))
-        mid_perm = [x for x in range(self.num_qudits) if x not in left_perm]
-        right_perm = [x + self.num_qudits for x in range(self.num_qudits)]
-
-        left_dim = int(np.prod([self.radixes[x] for x in left_perm]))
+        perm, inv_perm, shape, left_dim = _right_unfolding(
+            tuple(cast(CircuitLocation, location)),
+            self.radixes,
+        )
 
-        perm = left_perm + mid_perm + right_perm
         tensor_copy = self.tensor.copy()
         tensor_copy = tensor_copy.transpose(perm)
         tensor_copy = tensor_copy.reshape((left_dim, -1))
         tensor_copy = M @ tensor_copy  # TODO: Require out matrix to avoid copy
-
-        shape = list(self.radixes) * 2
-        shape = [shape[p] for p in perm]
         tensor_copy = tensor_copy.reshape(shape)
-        inv_perm = list(np.argsort(perm))
         tensor_copy = tensor_copy.transpose(inv_perm)
         out_M = tensor_copy.reshape((self.dim, self.dim))
         return out_M
@@ -290,32 +313,16 @@ class UnitaryBuilder(Unitary):
 
         See :func:`apply_left` for more info.
         """
-        location = cast(CircuitLocation, location)
-        left_perm = list(range(self.num_qudits))
-        mid_perm = [
-            x + self.num_qudits
-            for x in left_perm
-            if x not in location
-        ]
-        right_perm = [x + self.num_qudits for x in location]
-
-        right_dim = int(
-            np.prod([
-                self.radixes[x - self.num_qudits]
-                for x in right_perm
-            ]),
+        perm, inv_perm, shape, right_dim = _left_unfolding(
+            tuple(cast(CircuitLocation, location)),
+            self.radixes,
         )
 
-        perm = left_perm + mid_perm + right_perm
         tensor_copy = self.tensor.copy()
         tensor_copy = tensor_copy.transpose(perm)
         tensor_copy = tensor_copy.reshape((-1, right_dim))
         tensor_copy = tensor_copy @ M
-
-        shape = list(self.radixes) * 2
-        shape = [shape[p] for p in perm]
         tensor_copy = tensor_copy.reshape(shape)
-        inv_perm = list(np.argsort(perm))
         tensor_copy = tensor_copy.transpose(inv_perm)
         out_M = tensor_copy.reshape((self.dim, self.dim))
         return out_M
@@ -43,6 +43,14 @@ class TestGetUnitary:
         vug = VariableUnitaryGate(utry.num_qudits, utry.radixes)
         assert vug.get_unitary(params).get_distance_from(utry) < 1e-7
 
+    @pytest.mark.parametrize('value', [np.nan, np.inf, -np.inf])
+    def test_non_finite(self, value: float) -> None:
+        vug = VariableUnitaryGate(1)
+        params = [0.0] * vug.num_params
+        params[3] = value
+        with pytest.raises(ValueError):
+            vug.get_unitary(params)
+
 
 @given(unitaries())
 def test_optimize(utry: UnitaryMatrix) -> None:
@@ -56,3 +64,40 @@ def test_is(utry: UnitaryMatrix) -> None:
     vug1 = VariableUnitaryGate(utry.num_qudits, utry.radixes)
     vug2 = VariableUnitaryGate(utry.num_qudits)
     assert vug1 == vug2
+
+
+@given(unitaries(2, (2,)))
+def test_optimize_batch(utry: UnitaryMatrix) -> None:
+    vug = VariableUnitaryGate(utry.num_qudits, utry.radixes)
+    envs = np.array([
+        utry.numpy,
+        UnitaryMatrix.random(utry.num_qudits, utry.radixes).numpy,
+        np.random.random(utry.shape) + 1j * np.random.random(utry.shape),
+    ])
+    batch = vug.optimize_batch(envs)
+    assert batch.shape == (len(envs), vug.num_params)
+    for env, params in zip(envs, batch):
+        assert np.allclose(params, vug.optimize(env))
+
+
+@given(unitaries())
+def test_optimize_matches_polar_factor(utry: UnitaryMatrix) -> None:
+    vug = VariableUnitaryGate(utry.num_qudits, utry.radixes)
+    env = np.random.random(utry.shape) + 1j * np.random.random(utry.shape)
+    U, _, Vh = np.linalg.svd(env)
+    expected = vug.calc_params(Vh.conj().T @ U.conj().T)
+    assert np.allclose(vug.optimize(env), expected)
+
+
+class SinglePrecisionVariableUnitaryGate(VariableUnitaryGate):
+    _dtype = np.complex64
+
+
+@given(unitaries())
+def test_get_unitary_complex64(utry: UnitaryMatrix) -> None:
+    vug = SinglePrecisionVariableUnitaryGate(utry.num_qudits, utry.radixes)
+    params = vug.calc_params(utry)
+    result = vug.get_unitary(params)
+    assert isinstance(result, UnitaryMatrix)
+    assert result.numpy.dtype == np.complex128
+    assert np.allclose(result.numpy, utry.numpy, atol=1e-6)
@@ -7,6 +7,8 @@ from hypothesis import given
 
 from bqskit.ir.circuit import Circuit
 from bqskit.ir.gates import CircuitGate
+from bqskit.ir.gates import CNOTGate
+from bqskit.ir.gates import HGate
 from bqskit.utils.test.strategies import circuits
 
 
@@ -42,3 +44,32 @@ class TestPickle:
         utry = circuit.get_unitary()
         pickled = pickle.loads(pickle.dumps(circuit))
         assert utry == pickled.get_unitary()
+
+
+class TestGetUnitary:
+    @given(circuits([2, 2], max_gates=5))
+    def test_lazy_utry(self, circuit: Circuit) -> None:
+        gate = CircuitGate(circuit)
+        assert 'utry' not in gate.__dict__
+        assert gate.get_unitary() == circuit.get_unitary()
+        assert gate.get_unitary() is gate.get_unitary()
+        assert not gate.get_unitary().numpy.flags.writeable
+
+    @given(circuits([2, 2], max_gates=5))
+    def test_with_params(self, circuit: Circuit) -> None:
+        gate = CircuitGate(circuit)
+        params = [0.5] * circuit.num_params
+        if circuit.num_params > 0:
+            assert gate.get_unitary(params) == circuit.get_unitary(params)
+
+    def test_constant_unitary_and_grad(self) -> None:
+        circuit = Circuit(2)
+        circuit.append_gate(HGate(), [0])
+        circuit.append_gate(CNOTGate(), [0, 1])
+        gate = CircuitGate(circuit)
+        utry, grad = gate.get_unitary_and_grad()
+        expected_utry, expected_grad = circuit.get_unitary_and_grad()
+        assert utry == expected_utry
+        assert utry is gate.get_unitary()
+        assert grad.shape == expected_grad.shape
+        assert gate.get_grad().shape == expected_grad.shape
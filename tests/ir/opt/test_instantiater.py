@@ -0,0 +1,56 @@
+"""This test module verifies the Instantiater base class."""
+from __future__ import annotations
+
+import numpy as np
+
+from bqskit.ir.circuit import Circuit
+from bqskit.ir.gates import CNOTGate
+from bqskit.ir.gates import U3Gate
+from bqskit.ir.opt.instantiaters.minimization import Minimization
+
+
+def test_instantiate_multistart_threaded_matches_serial() -> None:
+    circuit = Circuit(2)
+    circuit.append_gate(U3Gate(), [0])
+    circuit.append_gate(U3Gate(), [1])
+    circuit.append_gate(CNOTGate(), [0, 1])
+    circuit.append_gate(U3Gate(), [0])
+    circuit.append_gate(U3Gate(), [1])
+    target = circuit.get_unitary(np.random.random(circuit.num_params))
+    starts = np.random.random((4, circuit.num_params))
+
+    instantiater = Minimization()
+    serial = instantiater.instantiate_multistart(circuit, target, starts)
+    threaded = instantiater.instantiate_multistart(
+        circuit,
+        target,
+        starts,
+        num_threads=4,
+    )
+
+    assert len(serial) == len(threaded) == len(starts)
+    for p1, p2 in zip(serial, threaded):
+        assert np.allclose(p1, p2)
+
+
+def test_circuit_instantiate_threaded_matches_serial() -> None:
+    circuit = Circuit(2)
+    circuit.append_gate(U3Gate(), [0])
+    circuit.append_gate(U3Gate(), [1])
+    circuit.append_gate(CNOTGate(), [0, 1])
+    circuit.append_gate(U3Gate(), [0])
+    circuit.append_gate(U3Gate(), [1])
+    target = circuit.get_unitary(np.random.random(circuit.num_params))
+
+    serial = circuit.copy()
+    serial.instantiate(target, 'minimization', multistarts=4, seed=1234)
+    threaded = circuit.copy()
+    threaded.instantiate(
+        target,
+        'minimization',
+        multistarts=4,
+        seed=1234,
+        num_threads=4,
+    )
+
+    assert np.allclose(serial.params, threaded.params)
@@ -0,0 +1,32 @@
+"""This test module verifies the MultiStartGenerator implementations."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bqskit.ir.circuit import Circuit
+from bqskit.ir.gates import CNOTGate
+from bqskit.ir.gates import U3Gate
+from bqskit.ir.opt.multistartgen import MultiStartGenerator
+from bqskit.ir.opt.multistartgens.diagonal import DiagonalStartGenerator
+from bqskit.ir.opt.multistartgens.random import RandomStartGenerator
+
+
+@pytest.mark.parametrize(
+    'start_gen',
+    [RandomStartGenerator(), DiagonalStartGenerator()],
+)
+def test_gen_starting_points_shape(start_gen: MultiStartGenerator) -> None:
+    circuit = Circuit(2)
+    circuit.append_gate(U3Gate(), [0])
+    circuit.append_gate(CNOTGate(), [0, 1])
+    circuit.append_gate(U3Gate(), [1])
+    target = circuit.get_unitary()
+
+    starts = start_gen.gen_starting_points(5, circuit, target)
+
+    assert isinstance(starts, np.ndarray)
+    assert starts.ndim == 2
+    assert starts.shape == (5, circuit.num_params)
+    assert starts.dtype == np.float64
+    assert np.all((starts >= 0) & (starts < 2 * np.pi))